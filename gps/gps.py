@@ -16,54 +16,78 @@ gps.set_pps(False)
 
 # It's nice to have a badger on the Badger
 BADGER_IMAGE = bytearray((88 * 108) // 8)
-open("badger_crop.bin", "rb").readinto(BADGER_IMAGE)
+with open("badger_crop.bin", "rb") as f:
+    if f.readinto(BADGER_IMAGE) != len(BADGER_IMAGE):
+        raise ValueError("badger_crop.bin is truncated")
 
 # Create badger display.  Fast update is fine as there isn't much change between updates
 display = badger2040.Badger2040()
 display.update_speed(badger2040.UPDATE_FAST)
 
     
-def display_time_pos():
+def draw_static():
+    # The badger panel never changes, so it is drawn once at start up
+    # and afterwards only the text area on the left is updated
     display.pen(15)
-    display.rectangle(0, 0, 192, 128)
+    display.clear()
     display.pen(2)
     display.rectangle(192, 0, 104, 128)
     display.pen(0)
     display.image(BADGER_IMAGE, w=88, h=108, x=200, y=10)
+    display.update()
+
+
+def display_time_pos():
+    display.pen(15)
+    display.rectangle(0, 0, 192, 128)
+    display.pen(0)
     
     if gps.valid:
-        date = "{day:02d}/{month:02d}/{year:04d}".format(**gps.__dict__)
-        time = "{hour:02d}:{minute:02d}:{second:02d}".format(**gps.__dict__)
-        lat = "{}  {}° {:.3f}".format(gps.latNS, gps.lat[:2], float(gps.lat[2:]))
-        lon = "{} {}° {:.3f}".format(gps.lonEW, gps.lon[:3], float(gps.lon[3:]))
-        alt = "Alt {:.1f}m".format(gps.altitude)
-        satellites = "Tracking {} sats".format(gps.satellites)
+        lines = (
+            (f"{gps.day:02d}/{gps.month:02d}/{gps.year:04d} {gps.hour:02d}:{gps.minute:02d}:{gps.second:02d}", 5, 5),
+            (f"{gps.latNS}  {gps.lat_deg:02d}° {gps.lat_min:.3f}", 20, 30),
+            (f"{gps.lonEW} {gps.lon_deg:03d}° {gps.lon_min:.3f}", 20, 50),
+            (f"Alt {gps.altitude:.1f}m", 20, 70),
+            (f"Tracking {gps.satellites} sats", 5, 95),
+        )
     
         display.font("bitmap8")
-        display.text(date + " " + time, 5, 5, 2)
-        display.text(lat, 20, 30, 2)
-        display.text(lon, 20, 50, 2)
-        display.text(alt, 20, 70, 2)
-        display.text(satellites, 5, 95, 2)
+        for text, x, y in lines:
+            display.text(text, x, y, 2)
         
     else:
         display.font("sans")
         display.text("GPS invalid", 5, 60, 1)
 
-    display.update()
+    display.partial_update(0, 0, 192, 128)
+
+def update_gps():
+    # Parsing is done in Python so run fast while updating, and drop back
+    # to slow to save power while sleeping.  The I2C bus speed depends on
+    # the system clock, so it has to be set up again after each change.
+    badger2040.system_speed(badger2040.SYSTEM_TURBO)
+    gps.init_i2c()
+    try:
+        gps.update()
+    finally:
+        badger2040.system_speed(badger2040.SYSTEM_SLOW)
+        gps.init_i2c()
+
+draw_static()
 
 valid = False
 next_display = 0
 
 while True:
-    gps.update()
+    update_gps()
     if gps.valid and not valid:
         valid = True
         next_display = gps.second
     
     if valid:
-        if gps.second >= next_display and gps.second - next_display < 30:
-            next_display = (gps.second + 10) % 60
+        sec = gps.second
+        if sec >= next_display and sec - next_display < 30:
+            next_display = (sec + 10) % 60
             display_time_pos()
         else:
             time.sleep(GPS_UDPATE_RATE)
@@ -2,7 +2,14 @@
 
 import machine
 import time
-import re
+from micropython import const
+
+_I2C_ADDR = const(16)
+_RX_CHUNK_SIZE = const(32)
+_SENTENCE_BUF_SIZE = const(128)
+_COMMAND_BUF_SIZE = const(82)  # Maximum NMEA sentence length
+
+_HEX_DIGITS = b"0123456789ABCDEF"
 
 class GPSTimeoutError(Exception):
     pass
@@ -12,11 +19,16 @@ class PA1010:
     
     def update(self):
         """Call update periodically to update data.
+        Reading stops once a GGA and RMC sentence have both been decoded and any
+        further data already read from the module has been used, so if the module
+        has buffered several fixes a later call may be needed to catch up to the latest.
         If update returns True, the following class members are populated:
            lat:    Text latitude in ddmm.mmmm format (e.g. 5606.1725)
            latNS:  Either N for North or S for South
            lon:    Text longitude in dddmm.mmmm format (e.g. 01404.0622)
            lonEW:  Either E for East or W for West
+           lat_deg, lat_min: Latitude degrees (integer) and minutes (float)
+           lon_deg, lon_min: Longitude degrees (integer) and minutes (float)
            altitude: The altitude of the module in metres (float, quite approximate)
            year:   The year (integer, note has a Y21K bug)
            month:  The month (integer)
@@ -25,13 +37,23 @@ class PA1010:
            minute: The minute (integer)
            second: The second (integer)
            satellites: The number of satellites being tracked (integer)
-           speed:  Speed over ground in knots (float)
-           heading: Direction of movement over ground in degrees from true North (float)"""
+           speed:  Speed over ground in knots (float, None if not reported)
+           heading: Direction of movement over ground in degrees from true North (float, None if not reported)"""
+        self._have_gga = False
+        self._have_rmc = False
         try:
-            # Keep reading data while any is available to ensure we update
-            # to the latest state
-            while True:
-                self._decode_sentence(self.read_sentence())
+            # Keep reading data until we have a full fix, or no more is available
+            while not (self._have_gga and self._have_rmc):
+                s = self.read_sentence()
+                if s is not None:
+                    self._decode_sentence(s)
+
+            # Use any newer sentences in the data already read, a zero timeout
+            # means a new chunk is only fetched to finish a sentence already started
+            while self._rx_pos < _RX_CHUNK_SIZE:
+                s = self.read_sentence(0)
+                if s is not None:
+                    self._decode_sentence(s)
         except (OSError, GPSTimeoutError):
             pass
         
@@ -71,7 +93,7 @@ class PA1010:
         self.set_update_rate(1)
         while True:
             s = self.read_sentence(1000)
-            if s.startswith("$PMTK001,220"):
+            if s is not None and s.startswith("$PMTK001,220"):
                 break
         self.send_command("PMTK225,2,{},{},{},{}".format(short_nav_acquisition, short_nav_sleep, long_nav_acquisition, long_nav_sleep))
 
@@ -84,15 +106,24 @@ class PA1010:
         self.send_command("PMTK103")
 
 
-    GGA_DECODE = re.compile(r"\$GNGGA,(\d\d)(\d\d)(\d\d)\.(\d\d\d),(\d+\.\d+),([NS]),(\d+\.\d+),([EW]),(\d),(\d+),[^,]+,([0-9.]+),")
-    RMC_DECODE = re.compile(r"\$GNRMC,(\d\d)(\d\d)(\d\d)\.(\d\d\d),([AV]),(\d+\.\d+),([NS]),(\d+\.\d+),([EW]),([0-9.]+),([0-9.]+),(\d\d)(\d\d)(\d\d),")
-    I2C_ADDR = 16
+    I2C_ADDR = _I2C_ADDR
     
     def __init__(self):
-        self.i2c = machine.I2C(scl=machine.Pin(5), sda=machine.Pin(4), id=0, freq=400000)
+        self.init_i2c()
         self.valid = False
         self.satellites = 0
         self.altitude = 0
+        self._have_gga = False
+        self._have_rmc = False
+
+        # Data is read from the module in chunks, which are then split into sentences
+        self._rx = bytearray(_RX_CHUNK_SIZE)
+        self._rx_pos = _RX_CHUNK_SIZE
+        self._sbuf = bytearray(_SENTENCE_BUF_SIZE)
+        self._cmd = bytearray(_COMMAND_BUF_SIZE)
+
+        # Parsers for the sentence types we are interested in, keyed by prefix
+        self._dispatch = {"$GNGGA": self._parse_gga, "$GNRMC": self._parse_rmc}
         
         # Reset to normal mode
         # Note that as we don't have access to the serial port we
@@ -104,7 +135,7 @@ class PA1010:
             while not reset:
                 try:
                     s = self.read_sentence(1000)
-                    if s.startswith("$PMTK010,00") or s.startswith("$G"):
+                    if s is not None and (s.startswith("$PMTK010,00") or s.startswith("$G")):
                         time.sleep(0.1)
                         self.set_normal_mode()
                         reset = True
@@ -114,6 +145,11 @@ class PA1010:
         # Only request GGA and RMC data
         self.send_command("PMTK314,0,1,0,3,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0")
         
+    def init_i2c(self):
+        """Initialise the I2C bus to the module.
+        The bus speed is derived from the system clock, so call this again after changing it."""
+        self.i2c = machine.I2C(scl=machine.Pin(5), sda=machine.Pin(4), id=0, freq=400000)
+
     def send_command(self, command, add_checksum=True):
         """Send a command string to the PA1010D.
         If add_checksum is True (the default) a NMEA checksum will automatically be computed and added.
@@ -121,65 +157,156 @@ class PA1010:
         if type(command) is not bytes:
             command = command.encode("ascii")
 
-        buf = bytearray()
-        buf += b'$'
-        buf += command
+        # Build the packet in place to avoid allocating on every send
+        buf = self._cmd
+        n = len(command) + 1
+        if n + 5 > _COMMAND_BUF_SIZE:
+            raise ValueError("Command too long")
+
+        buf[0] = 0x24  # '$'
+        buf[1:n] = command
         if add_checksum:
             checksum = 0
-            # bytes() is a real thing in Python 3
-            # so `for char in commaud` iterates through char ordinals
-            for char in command:
+            for char in memoryview(buf)[1:n]:
                 checksum ^= char
-            buf += b'*'  # Delimits checksum value
-            buf += "{checksum:02X}".format(checksum=checksum).encode("ascii")
-        buf += b'\r\n'
-        self.i2c.writeto(PA1010.I2C_ADDR, buf)
+            buf[n] = 0x2A  # '*' delimits checksum value
+            buf[n + 1] = _HEX_DIGITS[checksum >> 4]
+            buf[n + 2] = _HEX_DIGITS[checksum & 0xF]
+            n += 3
+        buf[n] = 0x0D
+        buf[n + 1] = 0x0A
+        self.i2c.writeto(_I2C_ADDR, memoryview(buf)[:n + 2])
 
     def read_sentence(self, timeout=50):
-        """Attempt to read an NMEA sentence from the PA1010D."""
-        buf = b""
+        """Attempt to read an NMEA sentence from the PA1010D.
+        Returns None if the sentence fails its checksum."""
+        rx = self._rx
+        pos = self._rx_pos
+        sbuf = self._sbuf
+        n = 0
         start = time.ticks_ms()
 
-        while time.ticks_diff(time.ticks_ms(), start) < timeout:
-            char = self.i2c.readfrom_mem(PA1010.I2C_ADDR, 0, 1)
+        while True:
+            if pos == _RX_CHUNK_SIZE:
+                # Only check the timeout when we need to fetch another chunk
+                if time.ticks_diff(time.ticks_ms(), start) >= timeout:
+                    raise GPSTimeoutError("Timeout waiting for readline")
+
+                # Mark the chunk as consumed in case the read fails
+                self._rx_pos = _RX_CHUNK_SIZE
+                self.i2c.readfrom_mem_into(_I2C_ADDR, 0, rx)
+                pos = 0
+
+            if n == 0:
+                # Skip anything before the start of a sentence
+                while pos < _RX_CHUNK_SIZE and rx[pos] != 0x24:  # '$'
+                    pos += 1
+                if pos == _RX_CHUNK_SIZE:
+                    # The module pads with newlines when it has no data,
+                    # so give it time to fill before reading again
+                    if rx[_RX_CHUNK_SIZE - 1] == 0x0A:
+                        time.sleep_us(500)
+                    continue
 
-            if len(buf) == 0 and char != b'$':
-                continue
-            elif len(buf) == 0:
                 # Started reading a command, give us more time
                 timeout += 100
 
-            buf += char
+            while pos < _RX_CHUNK_SIZE:
+                char = rx[pos]
+                pos += 1
+
+                # Check for end of line
+                # Should be a full \r\n since the GPS emits spurious newlines,
+                # which are dropped rather than stored
+                if char == 0x0A:
+                    if sbuf[n - 1] != 0x0D:
+                        continue
 
-            # Check for end of line
-            # Should be a full \r\n since the GPS emits spurious newlines
-            if buf[-2:] == b"\r\n":
-                # Remove line ending and spurious newlines from the sentence
-                return buf.decode("ascii").strip().replace("\n", "")
+                    self._rx_pos = pos
 
-        raise GPSTimeoutError("Timeout waiting for readline")
+                    # Sentence should end *hh\r, where the checksum hh is the XOR
+                    # of everything between the $ and the *.  Check this on the raw
+                    # bytes so corrupted sentences are rejected before decoding.
+                    star = n - 4
+                    if star < 1 or sbuf[star] != 0x2A:  # '*'
+                        return None
+
+                    mv = memoryview(sbuf)
+                    checksum = 0
+                    for char in mv[1:star]:
+                        checksum ^= char
+
+                    try:
+                        if int(bytes(mv[star + 1:n - 1]), 16) != checksum:
+                            return None
+                        return bytes(mv[:n - 1]).decode("ascii")
+                    except (ValueError, UnicodeError):
+                        return None
+
+                if n == _SENTENCE_BUF_SIZE:
+                    # Too long to be a valid sentence, look for the next one.
+                    # Step back so this byte is checked for the start of it.
+                    pos -= 1
+                    n = 0
+                    break
+
+                sbuf[n] = char
+                n += 1
 
     def _decode_sentence(self, buf):
-        m = PA1010.GGA_DECODE.match(buf)
-        if m is not None:
-            self._set_data_from_gga(m)
-        else:
-            m = PA1010.RMC_DECODE.match(buf)
-            if m is not None:
-                self._set_data_from_rmc(m)
-
-    def _set_data_from_rmc(self, m):
-        self.hour, self.minute, self.second, self.milli = [int(x) for x in m.groups()[:4]]
-        self.valid = m.group(5) == "A"
-        self.lat, self.latNS, self.lon, self.lonEW = m.groups()[5:9]
-        self.speed = float(m.group(10))
-        self.heading = float(m.group(11))
-        self.day, self.month, self.year = [int(x) for x in m.groups()[11:14]]
-        self.year += 2000
-
-    def _set_data_from_gga(self, m):
-        #self.hour, self.minute, self.seconds, self.millis = [int(x) for x in m.groups()[:4]]
-        #self.lat, self.latNS, self.lon, self.lonEW = m.groups()[4:8]
-        self.satellites = int(m.group(10))
-        self.altitude = float(m.group(11))
-        
\ No newline at end of file
+        parse = self._dispatch.get(buf[:6])
+        if parse is None:
+            return
+
+        try:
+            parse(buf)
+        except (ValueError, IndexError):
+            # Fields are left empty when there is no fix
+            pass
+
+    def _parse_rmc(self, buf):
+        # Only split as far as the date, the remaining fields are unused
+        fields = buf.split(",", 10)
+
+        # Parse everything before updating any state, so a sentence
+        # with a bad field is ignored as a whole
+        t = fields[1]
+        hour = int(t[0:2])
+        minute = int(t[2:4])
+        second = int(t[4:6])
+        milli = int(t[7:10])
+        valid = fields[2] == "A"
+        lat, latNS, lon, lonEW = fields[3], fields[4], fields[5], fields[6]
+        lat_deg = int(lat[:2])
+        lat_min = float(lat[2:])
+        lon_deg = int(lon[:3])
+        lon_min = float(lon[3:])
+        # Speed and heading are left empty by the module when it isn't moving
+        speed = float(fields[7]) if fields[7] else None
+        heading = float(fields[8]) if fields[8] else None
+        d = fields[9]
+        day = int(d[0:2])
+        month = int(d[2:4])
+        year = int(d[4:6]) + 2000
+
+        self.hour, self.minute, self.second, self.milli = hour, minute, second, milli
+        self.lat, self.latNS, self.lon, self.lonEW = lat, latNS, lon, lonEW
+        self.lat_deg, self.lat_min = lat_deg, lat_min
+        self.lon_deg, self.lon_min = lon_deg, lon_min
+        self.speed = speed
+        self.heading = heading
+        self.day, self.month, self.year = day, month, year
+        self.valid = valid
+        self._have_rmc = True
+
+    def _parse_gga(self, buf):
+        # Time and position come from RMC, so only satellites and altitude are needed
+        fields = buf.split(",", 10)
+        satellites = int(fields[7])
+        altitude = float(fields[9])
+
+        # Only update once both have parsed, as with RMC a sentence with
+        # no fix leaves the previous state alone
+        self.satellites = satellites
+        self.altitude = altitude
+        self._have_gga = True